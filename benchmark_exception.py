@@ -3,8 +3,24 @@ Traditional exception handling implementation.
 Raises exceptions and catches them at the top level.
 Only the lowest level (validate_format) raises errors.
 """
+from collections import Counter
 from datetime import datetime
-from typing import Any
+from typing import Any, Dict, List
+
+from fast_datetime import fast_parse
+
+
+# Punctuation dropped and separators turned into spaces by parse_datetime_*
+_CLEANUP_TABLE = str.maketrans({
+    ',': None, ';': None, '|': ' ', '\t': ' ', '\n': ' ', '\r': ' ',
+})
+
+# Field lookup keyed on the exact message type - one hashed lookup instead of
+# an isinstance() call; only plain dicts carry fields
+_FIELD_GETTER = {dict: dict.get}.get
+
+# Error type -> name, so the runners do one dict lookup instead of type(e).__name__
+_ERR_NAME = {ValueError: "ValueError", TypeError: "TypeError"}
 
 
 # =============================================================================
@@ -20,31 +36,15 @@ def validate_format_shallow_exc(datetime_str: str) -> datetime:
     if not datetime_str:
         raise ValueError("Empty datetime string")
 
-    # Attempt to parse - this will raise ValueError if invalid
-    try:
-        dt = datetime.strptime(datetime_str, "%Y-%m-%d %H:%M:%S")
-        return dt
-    except ValueError as e:
-        raise ValueError(f"Failed to parse datetime: {e}")
+    # Parse - the ValueError from the parser propagates as-is
+    return fast_parse(datetime_str)
 
 
 def parse_datetime_shallow_exc(timestamp_str: str) -> datetime:
     """Level 2: Non-trivial text processing, no errors raised."""
-    # Normalize whitespace - strip leading/trailing, collapse multiple spaces
-    normalized = ' '.join(timestamp_str.split())
-
-    # Remove common punctuation that might appear
-    cleaned = normalized.replace(',', '').replace(';', '').replace('|', ' ')
-
-    # Additional normalization - ensure single spaces
-    cleaned = ' '.join(cleaned.split())
-
-    # Convert to title case and back to test string operations
-    temp = cleaned.title().lower()
-
-    # Split and rejoin to ensure format
-    parts = temp.split()
-    rejoined = ' '.join(parts)
+    # Drop punctuation, turn separators into spaces, collapse whitespace and
+    # lowercase - one translate pass instead of a chain of replace() calls
+    rejoined = ' '.join(timestamp_str.translate(_CLEANUP_TABLE).split()).lower()
 
     # Call next level - may raise exception
     return validate_format_shallow_exc(rejoined)
@@ -52,15 +52,17 @@ def parse_datetime_shallow_exc(timestamp_str: str) -> datetime:
 
 def parse_message_shallow_exc(message: Any) -> datetime:
     """Level 1: Extract timestamp with text processing, no errors raised."""
-    # Convert message to string representation if needed
-    msg_str = str(message) if not isinstance(message, dict) else ""
-
-    # If it's a dict, extract timestamp (or use empty string)
-    if isinstance(message, dict):
-        timestamp = message.get("timestamp", "")
-    else:
-        # Try to extract something resembling a timestamp from string representation
-        timestamp = ""
+    # Dict messages carry a timestamp field, anything else gets an empty string
+    get = _FIELD_GETTER(type(message))
+    timestamp = get(message, "timestamp", "") if get is not None else ""
+
+    # Fast path: a string that is already normalized (printable, single inner
+    # spaces, nothing to strip or drop) goes straight to validation
+    if (type(timestamp) is str and timestamp and timestamp.isprintable()
+            and timestamp[0] not in ' "\'' and timestamp[-1] not in ' "\''
+            and '  ' not in timestamp and ',' not in timestamp
+            and ';' not in timestamp and '|' not in timestamp):
+        return validate_format_shallow_exc(timestamp.lower())
 
     # Convert timestamp to string with normalization
     timestamp_str = str(timestamp) if timestamp is not None else ""
@@ -92,31 +94,15 @@ def validate_format_deep_exc(datetime_str: str) -> datetime:
     if not datetime_str:
         raise ValueError("Empty datetime string")
 
-    # Attempt to parse - this will raise ValueError if invalid
-    try:
-        dt = datetime.strptime(datetime_str, "%Y-%m-%d %H:%M:%S")
-        return dt
-    except ValueError as e:
-        raise ValueError(f"Failed to parse datetime: {e}")
+    # Parse - the ValueError from the parser propagates as-is
+    return fast_parse(datetime_str)
 
 
 def parse_datetime_deep_exc(timestamp_str: str) -> datetime:
     """Level 4: Non-trivial text processing, no errors raised."""
-    # Normalize whitespace
-    normalized = ' '.join(timestamp_str.split())
-
-    # Remove common punctuation
-    cleaned = normalized.replace(',', '').replace(';', '').replace('|', ' ')
-
-    # Ensure single spaces
-    cleaned = ' '.join(cleaned.split())
-
-    # Case transformations
-    temp = cleaned.title().lower()
-
-    # Split and rejoin
-    parts = temp.split()
-    rejoined = ' '.join(parts)
+    # Drop punctuation, turn separators into spaces, collapse whitespace and
+    # lowercase - one translate pass instead of a chain of replace() calls
+    rejoined = ' '.join(timestamp_str.translate(_CLEANUP_TABLE).split()).lower()
 
     # Call next level - may raise exception
     return validate_format_deep_exc(rejoined)
@@ -124,11 +110,17 @@ def parse_datetime_deep_exc(timestamp_str: str) -> datetime:
 
 def parse_message_deep_exc(message: Any) -> datetime:
     """Level 3: Extract timestamp field, no errors raised."""
-    # Extract timestamp field if dict, otherwise empty string
-    if isinstance(message, dict):
-        timestamp = message.get("timestamp", "")
-    else:
-        timestamp = ""
+    # Dict messages carry a timestamp field, anything else gets an empty string
+    get = _FIELD_GETTER(type(message))
+    timestamp = get(message, "timestamp", "") if get is not None else ""
+
+    # Fast path: a string that is already normalized (printable, single inner
+    # spaces, nothing to strip or drop) goes straight to validation
+    if (type(timestamp) is str and timestamp and timestamp.isprintable()
+            and timestamp[0] != ' ' and timestamp[-1] != ' '
+            and '  ' not in timestamp and ',' not in timestamp
+            and ';' not in timestamp and '|' not in timestamp):
+        return validate_format_deep_exc(timestamp.lower())
 
     # Convert to string
     timestamp_str = str(timestamp) if timestamp is not None else ""
@@ -146,73 +138,151 @@ def parse_message_deep_exc(message: Any) -> datetime:
 
 def validate_message_deep_exc(message: Any) -> datetime:
     """Level 2: Message field extraction and processing, no errors raised."""
-    # Convert to dict representation if possible
-    if isinstance(message, dict):
-        msg_dict = message
-    else:
-        # Create empty dict for non-dict types
-        msg_dict = {}
-
-    # Extract all string values and concatenate (non-trivial processing)
-    str_values = [str(v) for v in msg_dict.values() if v is not None]
-    concatenated = ' '.join(str_values)
-
-    # Do some processing on concatenated string
-    processed = concatenated.strip().lower().upper().lower()
+    # Only plain dicts are passed on as-is, anything else becomes an empty dict
+    msg_dict = message if type(message) is dict else {}
 
     # Call next level with original message - may raise exception
     return parse_message_deep_exc(msg_dict)
 
 
 def process_batch_deep_exc(message: Any) -> datetime:
-    """Level 1: Top-level normalization, no errors raised."""
-    # Convert message to string and back to normalize
-    msg_str = str(message)
+    """Level 1: Top-level entry point, no errors raised."""
+    # Call next level with original message - may raise exception
+    return validate_message_deep_exc(message)
 
-    # Do some string operations (non-trivial processing)
-    processed = msg_str.strip().replace('  ', ' ')
 
-    # Character counting (non-trivial operation)
-    char_count = len(processed)
+# =============================================================================
+# INLINED STACKS (same pipeline, one frame)
+# =============================================================================
 
-    # String manipulation
-    normalized = processed.lower().upper().lower()
+def parse_message_shallow_exc_inlined(message: Any) -> datetime:
+    """Levels 1-3 of the shallow stack in a single frame, raises errors."""
+    # Level 1: extract timestamp
+    get = _FIELD_GETTER(type(message))
+    timestamp = get(message, "timestamp", "") if get is not None else ""
+
+    # Already-normalized strings only need lowercasing
+    if (type(timestamp) is str and timestamp and timestamp.isprintable()
+            and timestamp[0] not in ' "\'' and timestamp[-1] not in ' "\''
+            and '  ' not in timestamp and ',' not in timestamp
+            and ';' not in timestamp and '|' not in timestamp):
+        datetime_str = timestamp.lower()
+    else:
+        # Level 1: collapse whitespace, strip surrounding quotes
+        timestamp_str = str(timestamp) if timestamp is not None else ""
+        cleaned = ' '.join(timestamp_str.split()).strip('"').strip("'")
 
-    # Call next level with original message - may raise exception
-    return validate_message_deep_exc(message)
+        # Level 2: drop punctuation, collapse whitespace, lowercase
+        datetime_str = ' '.join(cleaned.translate(_CLEANUP_TABLE).split()).lower()
+
+    # Level 3: validate and parse
+    if not datetime_str:
+        raise ValueError("Empty datetime string")
+
+    return fast_parse(datetime_str)
+
+
+def process_batch_deep_exc_inlined(message: Any) -> datetime:
+    """Levels 1-5 of the deep stack in a single frame, raises errors."""
+    # Levels 1-3: extract timestamp field from dict messages
+    get = _FIELD_GETTER(type(message))
+    timestamp = get(message, "timestamp", "") if get is not None else ""
+
+    # Already-normalized strings only need lowercasing
+    if (type(timestamp) is str and timestamp and timestamp.isprintable()
+            and timestamp[0] != ' ' and timestamp[-1] != ' '
+            and '  ' not in timestamp and ',' not in timestamp
+            and ';' not in timestamp and '|' not in timestamp):
+        datetime_str = timestamp.lower()
+    else:
+        # Levels 3-4: control characters and punctuation, whitespace, case
+        timestamp_str = str(timestamp) if timestamp is not None else ""
+        datetime_str = ' '.join(timestamp_str.translate(_CLEANUP_TABLE).split()).lower()
+
+    # Level 5: validate and parse
+    if not datetime_str:
+        raise ValueError("Empty datetime string")
+
+    return fast_parse(datetime_str)
 
 
 # =============================================================================
 # ENTRY POINTS
 # =============================================================================
 
-def run_shallow_exc(test_cases):
+def run_shallow_exc(test_cases: List[Dict[str, Any]]) -> Dict[str, Any]:
     """Run shallow stack with exception handling."""
-    results = {"success": 0, "failure": 0, "errors": []}
+    # Counters live in locals - the loop never touches the results dict, and
+    # only the two errors validate_format can raise are caught
+    success = 0
+    failure = 0
+    errors: Counter[str] = Counter()
+    err_name = _ERR_NAME.get
 
     for test_case in test_cases:
+        message = test_case["message"]
         try:
-            message = test_case["message"]
-            result = parse_message_shallow_exc(message)
-            results["success"] += 1
-        except Exception as e:
-            results["failure"] += 1
-            results["errors"].append(type(e).__name__)
+            parse_message_shallow_exc(message)
+            success += 1
+        except (ValueError, TypeError) as e:
+            failure += 1
+            errors[err_name(type(e)) or type(e).__name__] += 1
 
-    return results
+    return {"success": success, "failure": failure, "errors": errors}
 
 
-def run_deep_exc(test_cases):
+def run_deep_exc(test_cases: List[Dict[str, Any]]) -> Dict[str, Any]:
     """Run deep stack with exception handling."""
-    results = {"success": 0, "failure": 0, "errors": []}
+    success = 0
+    failure = 0
+    errors: Counter[str] = Counter()
+    err_name = _ERR_NAME.get
 
     for test_case in test_cases:
+        message = test_case["message"]
         try:
-            message = test_case["message"]
-            result = process_batch_deep_exc(message)
-            results["success"] += 1
-        except Exception as e:
-            results["failure"] += 1
-            results["errors"].append(type(e).__name__)
-
-    return results
+            process_batch_deep_exc(message)
+            success += 1
+        except (ValueError, TypeError) as e:
+            failure += 1
+            errors[err_name(type(e)) or type(e).__name__] += 1
+
+    return {"success": success, "failure": failure, "errors": errors}
+
+
+def run_shallow_exc_inlined(test_cases: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Run the single-frame shallow stack with exception handling."""
+    success = 0
+    failure = 0
+    errors: Counter[str] = Counter()
+    err_name = _ERR_NAME.get
+
+    for test_case in test_cases:
+        message = test_case["message"]
+        try:
+            parse_message_shallow_exc_inlined(message)
+            success += 1
+        except (ValueError, TypeError) as e:
+            failure += 1
+            errors[err_name(type(e)) or type(e).__name__] += 1
+
+    return {"success": success, "failure": failure, "errors": errors}
+
+
+def run_deep_exc_inlined(test_cases: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Run the single-frame deep stack with exception handling."""
+    success = 0
+    failure = 0
+    errors: Counter[str] = Counter()
+    err_name = _ERR_NAME.get
+
+    for test_case in test_cases:
+        message = test_case["message"]
+        try:
+            process_batch_deep_exc_inlined(message)
+            success += 1
+        except (ValueError, TypeError) as e:
+            failure += 1
+            errors[err_name(type(e)) or type(e).__name__] += 1
+
+    return {"success": success, "failure": failure, "errors": errors}
@@ -4,8 +4,39 @@ Functions return: (Result | None, Exception | None)
 Check errors by checking if error is not None
 Only the lowest level (validate_format) returns errors.
 """
+from collections import Counter
 from datetime import datetime
-from typing import Any, Tuple
+from typing import Any, Dict, List, Tuple
+
+from fast_datetime import DATETIME_FORMAT, fast_parse
+
+
+# Punctuation dropped and separators turned into spaces by parse_datetime_*
+_CLEANUP_TABLE = str.maketrans({
+    ',': None, ';': None, '|': ' ', '\t': ' ', '\n': ' ', '\r': ' ',
+})
+
+# Field lookup keyed on the exact message type - one hashed lookup instead of
+# an isinstance() call; only plain dicts carry fields
+_FIELD_GETTER = {dict: dict.get}.get
+
+# Error type -> name, so the runners do one dict lookup instead of type(e).__name__
+_ERR_NAME = {ValueError: "ValueError", TypeError: "TypeError"}
+
+# Returned (never raised), so one shared instance is safe - no traceback to clobber
+_EMPTY_ERR = ValueError("Empty datetime string")
+# ...and the (result, error) pair around it is immutable, so it can be shared too
+_EMPTY_TUP = (None, _EMPTY_ERR)
+
+# What strptime's own DATETIME_FORMAT pattern accepts, spelled out for
+# run_shallow_tuple_vectorized: the same field alternatives, minus the year
+# 0000 and leap seconds 60/61 it lets through for datetime() to reject, since
+# pandas would parse those. Digits are ASCII only - other scripts' digits are
+# left to fast_parse
+_VECTORIZED_LAYOUT = (
+    r"(?!0000)[0-9]{4}-(?:1[0-2]|0[1-9]|[1-9])-(?:3[01]|[12][0-9]|0[1-9]|[1-9]| [1-9])"
+    r"\s+(?:2[0-3]|[01][0-9]|[0-9]):(?:[0-5][0-9]|[0-9]):(?:[0-5][0-9]|[0-9])"
+)
 
 
 # =============================================================================
@@ -16,36 +47,23 @@ def validate_format_shallow_tuple(datetime_str: str) -> Tuple[datetime | None, E
     """Level 3: ONLY level that returns errors - validates and parses datetime."""
     # This is the only function that can return errors
     if not isinstance(datetime_str, str):
-        return None, TypeError(f"Expected string, got {type(datetime_str).__name__}")
+        return None, TypeError("Expected string, got " + type(datetime_str).__name__)
 
     if not datetime_str:
-        return None, ValueError("Empty datetime string")
+        return _EMPTY_TUP
 
-    # Attempt to parse - this will return ValueError if invalid
+    # Attempt to parse - the parser's ValueError is returned as-is
     try:
-        dt = datetime.strptime(datetime_str, "%Y-%m-%d %H:%M:%S")
-        return dt, None
+        return fast_parse(datetime_str), None
     except ValueError as e:
-        return None, ValueError(f"Failed to parse datetime: {e}")
+        return None, e
 
 
 def parse_datetime_shallow_tuple(timestamp_str: str) -> Tuple[datetime | None, Exception | None]:
     """Level 2: Non-trivial text processing, propagates errors."""
-    # Normalize whitespace - strip leading/trailing, collapse multiple spaces
-    normalized = ' '.join(timestamp_str.split())
-
-    # Remove common punctuation that might appear
-    cleaned = normalized.replace(',', '').replace(';', '').replace('|', ' ')
-
-    # Additional normalization - ensure single spaces
-    cleaned = ' '.join(cleaned.split())
-
-    # Convert to title case and back to test string operations
-    temp = cleaned.title().lower()
-
-    # Split and rejoin to ensure format
-    parts = temp.split()
-    rejoined = ' '.join(parts)
+    # Drop punctuation, turn separators into spaces, collapse whitespace and
+    # lowercase - one translate pass instead of a chain of replace() calls
+    rejoined = ' '.join(timestamp_str.translate(_CLEANUP_TABLE).split()).lower()
 
     # Call next level - may return exception
     result, err = validate_format_shallow_tuple(rejoined)
@@ -57,15 +75,17 @@ def parse_datetime_shallow_tuple(timestamp_str: str) -> Tuple[datetime | None, E
 
 def parse_message_shallow_tuple(message: Any) -> Tuple[datetime | None, Exception | None]:
     """Level 1: Extract timestamp with text processing, propagates errors."""
-    # Convert message to string representation if needed
-    msg_str = str(message) if not isinstance(message, dict) else ""
-
-    # If it's a dict, extract timestamp (or use empty string)
-    if isinstance(message, dict):
-        timestamp = message.get("timestamp", "")
-    else:
-        # Try to extract something resembling a timestamp from string representation
-        timestamp = ""
+    # Dict messages carry a timestamp field, anything else gets an empty string
+    get = _FIELD_GETTER(type(message))
+    timestamp = get(message, "timestamp", "") if get is not None else ""
+
+    # Fast path: a string that is already normalized (printable, single inner
+    # spaces, nothing to strip or drop) goes straight to validation
+    if (type(timestamp) is str and timestamp and timestamp.isprintable()
+            and timestamp[0] not in ' "\'' and timestamp[-1] not in ' "\''
+            and '  ' not in timestamp and ',' not in timestamp
+            and ';' not in timestamp and '|' not in timestamp):
+        return validate_format_shallow_tuple(timestamp.lower())
 
     # Convert timestamp to string with normalization
     timestamp_str = str(timestamp) if timestamp is not None else ""
@@ -95,36 +115,23 @@ def validate_format_deep_tuple(datetime_str: str) -> Tuple[datetime | None, Exce
     """Level 5: ONLY level that returns errors - validates and parses datetime."""
     # This is the only function that can return errors
     if not isinstance(datetime_str, str):
-        return None, TypeError(f"Expected string, got {type(datetime_str).__name__}")
+        return None, TypeError("Expected string, got " + type(datetime_str).__name__)
 
     if not datetime_str:
-        return None, ValueError("Empty datetime string")
+        return _EMPTY_TUP
 
-    # Attempt to parse - this will return ValueError if invalid
+    # Attempt to parse - the parser's ValueError is returned as-is
     try:
-        dt = datetime.strptime(datetime_str, "%Y-%m-%d %H:%M:%S")
-        return dt, None
+        return fast_parse(datetime_str), None
     except ValueError as e:
-        return None, ValueError(f"Failed to parse datetime: {e}")
+        return None, e
 
 
 def parse_datetime_deep_tuple(timestamp_str: str) -> Tuple[datetime | None, Exception | None]:
     """Level 4: Non-trivial text processing, propagates errors."""
-    # Normalize whitespace
-    normalized = ' '.join(timestamp_str.split())
-
-    # Remove common punctuation
-    cleaned = normalized.replace(',', '').replace(';', '').replace('|', ' ')
-
-    # Ensure single spaces
-    cleaned = ' '.join(cleaned.split())
-
-    # Case transformations
-    temp = cleaned.title().lower()
-
-    # Split and rejoin
-    parts = temp.split()
-    rejoined = ' '.join(parts)
+    # Drop punctuation, turn separators into spaces, collapse whitespace and
+    # lowercase - one translate pass instead of a chain of replace() calls
+    rejoined = ' '.join(timestamp_str.translate(_CLEANUP_TABLE).split()).lower()
 
     # Call next level - may return exception
     result, err = validate_format_deep_tuple(rejoined)
@@ -136,11 +143,17 @@ def parse_datetime_deep_tuple(timestamp_str: str) -> Tuple[datetime | None, Exce
 
 def parse_message_deep_tuple(message: Any) -> Tuple[datetime | None, Exception | None]:
     """Level 3: Extract timestamp field, propagates errors."""
-    # Extract timestamp field if dict, otherwise empty string
-    if isinstance(message, dict):
-        timestamp = message.get("timestamp", "")
-    else:
-        timestamp = ""
+    # Dict messages carry a timestamp field, anything else gets an empty string
+    get = _FIELD_GETTER(type(message))
+    timestamp = get(message, "timestamp", "") if get is not None else ""
+
+    # Fast path: a string that is already normalized (printable, single inner
+    # spaces, nothing to strip or drop) goes straight to validation
+    if (type(timestamp) is str and timestamp and timestamp.isprintable()
+            and timestamp[0] != ' ' and timestamp[-1] != ' '
+            and '  ' not in timestamp and ',' not in timestamp
+            and ';' not in timestamp and '|' not in timestamp):
+        return validate_format_deep_tuple(timestamp.lower())
 
     # Convert to string
     timestamp_str = str(timestamp) if timestamp is not None else ""
@@ -161,19 +174,8 @@ def parse_message_deep_tuple(message: Any) -> Tuple[datetime | None, Exception |
 
 def validate_message_deep_tuple(message: Any) -> Tuple[datetime | None, Exception | None]:
     """Level 2: Message field extraction and processing, propagates errors."""
-    # Convert to dict representation if possible
-    if isinstance(message, dict):
-        msg_dict = message
-    else:
-        # Create empty dict for non-dict types
-        msg_dict = {}
-
-    # Extract all string values and concatenate (non-trivial processing)
-    str_values = [str(v) for v in msg_dict.values() if v is not None]
-    concatenated = ' '.join(str_values)
-
-    # Do some processing on concatenated string
-    processed = concatenated.strip().lower().upper().lower()
+    # Only plain dicts are passed on as-is, anything else becomes an empty dict
+    msg_dict = message if type(message) is dict else {}
 
     # Call next level with original message - may return exception
     result, err = parse_message_deep_tuple(msg_dict)
@@ -184,19 +186,7 @@ def validate_message_deep_tuple(message: Any) -> Tuple[datetime | None, Exceptio
 
 
 def process_batch_deep_tuple(message: Any) -> Tuple[datetime | None, Exception | None]:
-    """Level 1: Top-level normalization, propagates errors."""
-    # Convert message to string and back to normalize
-    msg_str = str(message)
-
-    # Do some string operations (non-trivial processing)
-    processed = msg_str.strip().replace('  ', ' ')
-
-    # Character counting (non-trivial operation)
-    char_count = len(processed)
-
-    # String manipulation
-    normalized = processed.lower().upper().lower()
-
+    """Level 1: Top-level entry point, propagates errors."""
     # Call next level with original message - may return exception
     result, err = validate_message_deep_tuple(message)
     if err is not None:
@@ -205,39 +195,221 @@ def process_batch_deep_tuple(message: Any) -> Tuple[datetime | None, Exception |
     return result, None
 
 
+# =============================================================================
+# INLINED STACKS (same pipeline, one frame)
+# =============================================================================
+
+def parse_message_shallow_tuple_inlined(message: Any) -> Tuple[datetime | None, Exception | None]:
+    """Levels 1-3 of the shallow stack in a single frame, returns errors."""
+    # Level 1: extract timestamp
+    get = _FIELD_GETTER(type(message))
+    timestamp = get(message, "timestamp", "") if get is not None else ""
+
+    # Already-normalized strings only need lowercasing
+    if (type(timestamp) is str and timestamp and timestamp.isprintable()
+            and timestamp[0] not in ' "\'' and timestamp[-1] not in ' "\''
+            and '  ' not in timestamp and ',' not in timestamp
+            and ';' not in timestamp and '|' not in timestamp):
+        datetime_str = timestamp.lower()
+    else:
+        # Level 1: collapse whitespace, strip surrounding quotes
+        timestamp_str = str(timestamp) if timestamp is not None else ""
+        cleaned = ' '.join(timestamp_str.split()).strip('"').strip("'")
+
+        # Level 2: drop punctuation, collapse whitespace, lowercase
+        datetime_str = ' '.join(cleaned.translate(_CLEANUP_TABLE).split()).lower()
+
+    # Level 3: validate and parse
+    if not datetime_str:
+        return _EMPTY_TUP
+
+    try:
+        return fast_parse(datetime_str), None
+    except ValueError as e:
+        return None, e
+
+
+def process_batch_deep_tuple_inlined(message: Any) -> Tuple[datetime | None, Exception | None]:
+    """Levels 1-5 of the deep stack in a single frame, returns errors."""
+    # Levels 1-3: extract timestamp field from dict messages
+    get = _FIELD_GETTER(type(message))
+    timestamp = get(message, "timestamp", "") if get is not None else ""
+
+    # Already-normalized strings only need lowercasing
+    if (type(timestamp) is str and timestamp and timestamp.isprintable()
+            and timestamp[0] != ' ' and timestamp[-1] != ' '
+            and '  ' not in timestamp and ',' not in timestamp
+            and ';' not in timestamp and '|' not in timestamp):
+        datetime_str = timestamp.lower()
+    else:
+        # Levels 3-4: control characters and punctuation, whitespace, case
+        timestamp_str = str(timestamp) if timestamp is not None else ""
+        datetime_str = ' '.join(timestamp_str.translate(_CLEANUP_TABLE).split()).lower()
+
+    # Level 5: validate and parse
+    if not datetime_str:
+        return _EMPTY_TUP
+
+    try:
+        return fast_parse(datetime_str), None
+    except ValueError as e:
+        return None, e
+
+
 # =============================================================================
 # ENTRY POINTS
 # =============================================================================
 
-def run_shallow_tuple(test_cases):
+def run_shallow_tuple(test_cases: List[Dict[str, Any]]) -> Dict[str, Any]:
     """Run shallow stack with tuple error handling."""
-    results = {"success": 0, "failure": 0, "errors": []}
+    success = 0
+    failure = 0
+    empty = 0
+    errors: Counter[str] = Counter()
+    err_name = _ERR_NAME.get
 
     for test_case in test_cases:
         message = test_case["message"]
         result, err = parse_message_shallow_tuple(message)
 
-        if err is not None:
-            results["failure"] += 1
-            results["errors"].append(type(err).__name__)
+        if err is None:
+            success += 1
+        elif err is _EMPTY_ERR:
+            empty += 1
         else:
-            results["success"] += 1
+            failure += 1
+            errors[err_name(type(err)) or type(err).__name__] += 1
+
+    # The shared empty-timestamp error is tallied separately and folded in once
+    if empty:
+        failure += empty
+        errors["ValueError"] += empty
 
-    return results
+    return {"success": success, "failure": failure, "errors": errors}
 
 
-def run_deep_tuple(test_cases):
+def run_deep_tuple(test_cases: List[Dict[str, Any]]) -> Dict[str, Any]:
     """Run deep stack with tuple error handling."""
-    results = {"success": 0, "failure": 0, "errors": []}
+    success = 0
+    failure = 0
+    empty = 0
+    errors: Counter[str] = Counter()
+    err_name = _ERR_NAME.get
 
     for test_case in test_cases:
         message = test_case["message"]
         result, err = process_batch_deep_tuple(message)
 
-        if err is not None:
-            results["failure"] += 1
-            results["errors"].append(type(err).__name__)
+        if err is None:
+            success += 1
+        elif err is _EMPTY_ERR:
+            empty += 1
+        else:
+            failure += 1
+            errors[err_name(type(err)) or type(err).__name__] += 1
+
+    # The shared empty-timestamp error is tallied separately and folded in once
+    if empty:
+        failure += empty
+        errors["ValueError"] += empty
+
+    return {"success": success, "failure": failure, "errors": errors}
+
+
+def run_shallow_tuple_inlined(test_cases: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Run the single-frame shallow stack with tuple error handling."""
+    success = 0
+    failure = 0
+    empty = 0
+    errors: Counter[str] = Counter()
+    err_name = _ERR_NAME.get
+
+    for test_case in test_cases:
+        message = test_case["message"]
+        result, err = parse_message_shallow_tuple_inlined(message)
+
+        if err is None:
+            success += 1
+        elif err is _EMPTY_ERR:
+            empty += 1
+        else:
+            failure += 1
+            errors[err_name(type(err)) or type(err).__name__] += 1
+
+    # The shared empty-timestamp error is tallied separately and folded in once
+    if empty:
+        failure += empty
+        errors["ValueError"] += empty
+
+    return {"success": success, "failure": failure, "errors": errors}
+
+
+def run_deep_tuple_inlined(test_cases: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Run the single-frame deep stack with tuple error handling."""
+    success = 0
+    failure = 0
+    empty = 0
+    errors: Counter[str] = Counter()
+    err_name = _ERR_NAME.get
+
+    for test_case in test_cases:
+        message = test_case["message"]
+        result, err = process_batch_deep_tuple_inlined(message)
+
+        if err is None:
+            success += 1
+        elif err is _EMPTY_ERR:
+            empty += 1
         else:
-            results["success"] += 1
+            failure += 1
+            errors[err_name(type(err)) or type(err).__name__] += 1
+
+    # The shared empty-timestamp error is tallied separately and folded in once
+    if empty:
+        failure += empty
+        errors["ValueError"] += empty
+
+    return {"success": success, "failure": failure, "errors": errors}
 
-    return results
+
+def run_shallow_tuple_vectorized(test_cases: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Run the shallow pipeline over all test cases in one pandas pass.
+
+    Batch counterpart of run_shallow_tuple - failures surface as NaT rather than
+    per-message error values, so each is counted as a ValueError. Needs pandas.
+    """
+    import pandas as pd  # type: ignore[import-untyped]
+
+    # Only string timestamps on dict messages can ever parse
+    timestamps = []
+    for test_case in test_cases:
+        get = _FIELD_GETTER(type(test_case["message"]))
+        timestamp = get(test_case["message"], "timestamp", "") if get is not None else ""
+        timestamps.append(timestamp if type(timestamp) is str else "")
+
+    # Same normalization as parse_message_shallow_tuple_inlined, column-wise
+    cleaned = (
+        pd.Series(timestamps, dtype="string")
+        .str.split().str.join(" ").str.strip('"').str.strip("'")
+        .str.translate(_CLEANUP_TABLE)
+        .str.split().str.join(" ").str.lower()
+    )
+
+    # pandas' parser is looser than strptime (it takes a leading '-' on the
+    # year, for one), so only layouts strptime accepts are handed to it; the
+    # remaining range checks (Feb 30 and the like) are left to to_datetime
+    layout_ok = cleaned.str.fullmatch(_VECTORIZED_LAYOUT).fillna(False)
+    parsed = pd.to_datetime(cleaned.where(layout_ok), format=DATETIME_FORMAT, errors="coerce")
+    success = int(parsed.notna().sum())
+
+    # strptime also reads some non-ASCII digits, so those rows are parsed one by one
+    for timestamp in cleaned[~cleaned.str.isascii()]:
+        try:
+            fast_parse(timestamp)
+            success += 1
+        except ValueError:
+            pass
+
+    failure = len(parsed) - success
+    errors = Counter({"ValueError": failure}) if failure else Counter()
+    return {"success": success, "failure": failure, "errors": errors}
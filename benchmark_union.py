@@ -4,8 +4,27 @@ Functions return: Result | Exception
 Check errors with isinstance(result, Exception)
 Only the lowest level (validate_format) returns errors.
 """
+from collections import Counter
 from datetime import datetime
-from typing import Any
+from typing import Any, Dict, List
+
+from fast_datetime import fast_parse
+
+
+# Punctuation dropped and separators turned into spaces by parse_datetime_*
+_CLEANUP_TABLE = str.maketrans({
+    ',': None, ';': None, '|': ' ', '\t': ' ', '\n': ' ', '\r': ' ',
+})
+
+# Field lookup keyed on the exact message type - one hashed lookup instead of
+# an isinstance() call; only plain dicts carry fields
+_FIELD_GETTER = {dict: dict.get}.get
+
+# Error type -> name, so the runners do one dict lookup instead of type(e).__name__
+_ERR_NAME = {ValueError: "ValueError", TypeError: "TypeError"}
+
+# Returned (never raised), so one shared instance is safe - no traceback to clobber
+_EMPTY_ERR = ValueError("Empty datetime string")
 
 
 # =============================================================================
@@ -16,36 +35,23 @@ def validate_format_shallow_union(datetime_str: str) -> datetime | Exception:
     """Level 3: ONLY level that returns errors - validates and parses datetime."""
     # This is the only function that can return errors
     if not isinstance(datetime_str, str):
-        return TypeError(f"Expected string, got {type(datetime_str).__name__}")
+        return TypeError("Expected string, got " + type(datetime_str).__name__)
 
     if not datetime_str:
-        return ValueError("Empty datetime string")
+        return _EMPTY_ERR
 
-    # Attempt to parse - this will return ValueError if invalid
+    # Attempt to parse - the parser's ValueError is returned as-is
     try:
-        dt = datetime.strptime(datetime_str, "%Y-%m-%d %H:%M:%S")
-        return dt
+        return fast_parse(datetime_str)
     except ValueError as e:
-        return ValueError(f"Failed to parse datetime: {e}")
+        return e
 
 
 def parse_datetime_shallow_union(timestamp_str: str) -> datetime | Exception:
     """Level 2: Non-trivial text processing, propagates errors."""
-    # Normalize whitespace - strip leading/trailing, collapse multiple spaces
-    normalized = ' '.join(timestamp_str.split())
-
-    # Remove common punctuation that might appear
-    cleaned = normalized.replace(',', '').replace(';', '').replace('|', ' ')
-
-    # Additional normalization - ensure single spaces
-    cleaned = ' '.join(cleaned.split())
-
-    # Convert to title case and back to test string operations
-    temp = cleaned.title().lower()
-
-    # Split and rejoin to ensure format
-    parts = temp.split()
-    rejoined = ' '.join(parts)
+    # Drop punctuation, turn separators into spaces, collapse whitespace and
+    # lowercase - one translate pass instead of a chain of replace() calls
+    rejoined = ' '.join(timestamp_str.translate(_CLEANUP_TABLE).split()).lower()
 
     # Call next level - may return exception
     result = validate_format_shallow_union(rejoined)
@@ -57,15 +63,17 @@ def parse_datetime_shallow_union(timestamp_str: str) -> datetime | Exception:
 
 def parse_message_shallow_union(message: Any) -> datetime | Exception:
     """Level 1: Extract timestamp with text processing, propagates errors."""
-    # Convert message to string representation if needed
-    msg_str = str(message) if not isinstance(message, dict) else ""
-
-    # If it's a dict, extract timestamp (or use empty string)
-    if isinstance(message, dict):
-        timestamp = message.get("timestamp", "")
-    else:
-        # Try to extract something resembling a timestamp from string representation
-        timestamp = ""
+    # Dict messages carry a timestamp field, anything else gets an empty string
+    get = _FIELD_GETTER(type(message))
+    timestamp = get(message, "timestamp", "") if get is not None else ""
+
+    # Fast path: a string that is already normalized (printable, single inner
+    # spaces, nothing to strip or drop) goes straight to validation
+    if (type(timestamp) is str and timestamp and timestamp.isprintable()
+            and timestamp[0] not in ' "\'' and timestamp[-1] not in ' "\''
+            and '  ' not in timestamp and ',' not in timestamp
+            and ';' not in timestamp and '|' not in timestamp):
+        return validate_format_shallow_union(timestamp.lower())
 
     # Convert timestamp to string with normalization
     timestamp_str = str(timestamp) if timestamp is not None else ""
@@ -95,36 +103,23 @@ def validate_format_deep_union(datetime_str: str) -> datetime | Exception:
     """Level 5: ONLY level that returns errors - validates and parses datetime."""
     # This is the only function that can return errors
     if not isinstance(datetime_str, str):
-        return TypeError(f"Expected string, got {type(datetime_str).__name__}")
+        return TypeError("Expected string, got " + type(datetime_str).__name__)
 
     if not datetime_str:
-        return ValueError("Empty datetime string")
+        return _EMPTY_ERR
 
-    # Attempt to parse - this will return ValueError if invalid
+    # Attempt to parse - the parser's ValueError is returned as-is
     try:
-        dt = datetime.strptime(datetime_str, "%Y-%m-%d %H:%M:%S")
-        return dt
+        return fast_parse(datetime_str)
     except ValueError as e:
-        return ValueError(f"Failed to parse datetime: {e}")
+        return e
 
 
 def parse_datetime_deep_union(timestamp_str: str) -> datetime | Exception:
     """Level 4: Non-trivial text processing, propagates errors."""
-    # Normalize whitespace
-    normalized = ' '.join(timestamp_str.split())
-
-    # Remove common punctuation
-    cleaned = normalized.replace(',', '').replace(';', '').replace('|', ' ')
-
-    # Ensure single spaces
-    cleaned = ' '.join(cleaned.split())
-
-    # Case transformations
-    temp = cleaned.title().lower()
-
-    # Split and rejoin
-    parts = temp.split()
-    rejoined = ' '.join(parts)
+    # Drop punctuation, turn separators into spaces, collapse whitespace and
+    # lowercase - one translate pass instead of a chain of replace() calls
+    rejoined = ' '.join(timestamp_str.translate(_CLEANUP_TABLE).split()).lower()
 
     # Call next level - may return exception
     result = validate_format_deep_union(rejoined)
@@ -136,11 +131,17 @@ def parse_datetime_deep_union(timestamp_str: str) -> datetime | Exception:
 
 def parse_message_deep_union(message: Any) -> datetime | Exception:
     """Level 3: Extract timestamp field, propagates errors."""
-    # Extract timestamp field if dict, otherwise empty string
-    if isinstance(message, dict):
-        timestamp = message.get("timestamp", "")
-    else:
-        timestamp = ""
+    # Dict messages carry a timestamp field, anything else gets an empty string
+    get = _FIELD_GETTER(type(message))
+    timestamp = get(message, "timestamp", "") if get is not None else ""
+
+    # Fast path: a string that is already normalized (printable, single inner
+    # spaces, nothing to strip or drop) goes straight to validation
+    if (type(timestamp) is str and timestamp and timestamp.isprintable()
+            and timestamp[0] != ' ' and timestamp[-1] != ' '
+            and '  ' not in timestamp and ',' not in timestamp
+            and ';' not in timestamp and '|' not in timestamp):
+        return validate_format_deep_union(timestamp.lower())
 
     # Convert to string
     timestamp_str = str(timestamp) if timestamp is not None else ""
@@ -161,19 +162,8 @@ def parse_message_deep_union(message: Any) -> datetime | Exception:
 
 def validate_message_deep_union(message: Any) -> datetime | Exception:
     """Level 2: Message field extraction and processing, propagates errors."""
-    # Convert to dict representation if possible
-    if isinstance(message, dict):
-        msg_dict = message
-    else:
-        # Create empty dict for non-dict types
-        msg_dict = {}
-
-    # Extract all string values and concatenate (non-trivial processing)
-    str_values = [str(v) for v in msg_dict.values() if v is not None]
-    concatenated = ' '.join(str_values)
-
-    # Do some processing on concatenated string
-    processed = concatenated.strip().lower().upper().lower()
+    # Only plain dicts are passed on as-is, anything else becomes an empty dict
+    msg_dict = message if type(message) is dict else {}
 
     # Call next level with original message - may return exception
     result = parse_message_deep_union(msg_dict)
@@ -184,19 +174,7 @@ def validate_message_deep_union(message: Any) -> datetime | Exception:
 
 
 def process_batch_deep_union(message: Any) -> datetime | Exception:
-    """Level 1: Top-level normalization, propagates errors."""
-    # Convert message to string and back to normalize
-    msg_str = str(message)
-
-    # Do some string operations (non-trivial processing)
-    processed = msg_str.strip().replace('  ', ' ')
-
-    # Character counting (non-trivial operation)
-    char_count = len(processed)
-
-    # String manipulation
-    normalized = processed.lower().upper().lower()
-
+    """Level 1: Top-level entry point, propagates errors."""
     # Call next level with original message - may return exception
     result = validate_message_deep_union(message)
     if isinstance(result, Exception):
@@ -205,39 +183,178 @@ def process_batch_deep_union(message: Any) -> datetime | Exception:
     return result
 
 
+# =============================================================================
+# INLINED STACKS (same pipeline, one frame)
+# =============================================================================
+
+def parse_message_shallow_union_inlined(message: Any) -> datetime | Exception:
+    """Levels 1-3 of the shallow stack in a single frame, returns errors."""
+    # Level 1: extract timestamp
+    get = _FIELD_GETTER(type(message))
+    timestamp = get(message, "timestamp", "") if get is not None else ""
+
+    # Already-normalized strings only need lowercasing
+    if (type(timestamp) is str and timestamp and timestamp.isprintable()
+            and timestamp[0] not in ' "\'' and timestamp[-1] not in ' "\''
+            and '  ' not in timestamp and ',' not in timestamp
+            and ';' not in timestamp and '|' not in timestamp):
+        datetime_str = timestamp.lower()
+    else:
+        # Level 1: collapse whitespace, strip surrounding quotes
+        timestamp_str = str(timestamp) if timestamp is not None else ""
+        cleaned = ' '.join(timestamp_str.split()).strip('"').strip("'")
+
+        # Level 2: drop punctuation, collapse whitespace, lowercase
+        datetime_str = ' '.join(cleaned.translate(_CLEANUP_TABLE).split()).lower()
+
+    # Level 3: validate and parse
+    if not datetime_str:
+        return _EMPTY_ERR
+
+    try:
+        return fast_parse(datetime_str)
+    except ValueError as e:
+        return e
+
+
+def process_batch_deep_union_inlined(message: Any) -> datetime | Exception:
+    """Levels 1-5 of the deep stack in a single frame, returns errors."""
+    # Levels 1-3: extract timestamp field from dict messages
+    get = _FIELD_GETTER(type(message))
+    timestamp = get(message, "timestamp", "") if get is not None else ""
+
+    # Already-normalized strings only need lowercasing
+    if (type(timestamp) is str and timestamp and timestamp.isprintable()
+            and timestamp[0] != ' ' and timestamp[-1] != ' '
+            and '  ' not in timestamp and ',' not in timestamp
+            and ';' not in timestamp and '|' not in timestamp):
+        datetime_str = timestamp.lower()
+    else:
+        # Levels 3-4: control characters and punctuation, whitespace, case
+        timestamp_str = str(timestamp) if timestamp is not None else ""
+        datetime_str = ' '.join(timestamp_str.translate(_CLEANUP_TABLE).split()).lower()
+
+    # Level 5: validate and parse
+    if not datetime_str:
+        return _EMPTY_ERR
+
+    try:
+        return fast_parse(datetime_str)
+    except ValueError as e:
+        return e
+
+
 # =============================================================================
 # ENTRY POINTS
 # =============================================================================
 
-def run_shallow_union(test_cases):
+def run_shallow_union(test_cases: List[Dict[str, Any]]) -> Dict[str, Any]:
     """Run shallow stack with union error handling."""
-    results = {"success": 0, "failure": 0, "errors": []}
+    success = 0
+    failure = 0
+    empty = 0
+    errors: Counter[str] = Counter()
+    err_name = _ERR_NAME.get
 
     for test_case in test_cases:
         message = test_case["message"]
         result = parse_message_shallow_union(message)
 
-        if isinstance(result, Exception):
-            results["failure"] += 1
-            results["errors"].append(type(result).__name__)
+        if not isinstance(result, Exception):
+            success += 1
+        elif result is _EMPTY_ERR:
+            empty += 1
         else:
-            results["success"] += 1
+            failure += 1
+            errors[err_name(type(result)) or type(result).__name__] += 1
 
-    return results
+    # The shared empty-timestamp error is tallied separately and folded in once
+    if empty:
+        failure += empty
+        errors["ValueError"] += empty
 
+    return {"success": success, "failure": failure, "errors": errors}
 
-def run_deep_union(test_cases):
+
+def run_deep_union(test_cases: List[Dict[str, Any]]) -> Dict[str, Any]:
     """Run deep stack with union error handling."""
-    results = {"success": 0, "failure": 0, "errors": []}
+    success = 0
+    failure = 0
+    empty = 0
+    errors: Counter[str] = Counter()
+    err_name = _ERR_NAME.get
 
     for test_case in test_cases:
         message = test_case["message"]
         result = process_batch_deep_union(message)
 
-        if isinstance(result, Exception):
-            results["failure"] += 1
-            results["errors"].append(type(result).__name__)
+        if not isinstance(result, Exception):
+            success += 1
+        elif result is _EMPTY_ERR:
+            empty += 1
         else:
-            results["success"] += 1
+            failure += 1
+            errors[err_name(type(result)) or type(result).__name__] += 1
+
+    # The shared empty-timestamp error is tallied separately and folded in once
+    if empty:
+        failure += empty
+        errors["ValueError"] += empty
+
+    return {"success": success, "failure": failure, "errors": errors}
+
+
+def run_shallow_union_inlined(test_cases: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Run the single-frame shallow stack with union error handling."""
+    success = 0
+    failure = 0
+    empty = 0
+    errors: Counter[str] = Counter()
+    err_name = _ERR_NAME.get
+
+    for test_case in test_cases:
+        message = test_case["message"]
+        result = parse_message_shallow_union_inlined(message)
+
+        if not isinstance(result, Exception):
+            success += 1
+        elif result is _EMPTY_ERR:
+            empty += 1
+        else:
+            failure += 1
+            errors[err_name(type(result)) or type(result).__name__] += 1
+
+    # The shared empty-timestamp error is tallied separately and folded in once
+    if empty:
+        failure += empty
+        errors["ValueError"] += empty
+
+    return {"success": success, "failure": failure, "errors": errors}
+
+
+def run_deep_union_inlined(test_cases: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Run the single-frame deep stack with union error handling."""
+    success = 0
+    failure = 0
+    empty = 0
+    errors: Counter[str] = Counter()
+    err_name = _ERR_NAME.get
+
+    for test_case in test_cases:
+        message = test_case["message"]
+        result = process_batch_deep_union_inlined(message)
+
+        if not isinstance(result, Exception):
+            success += 1
+        elif result is _EMPTY_ERR:
+            empty += 1
+        else:
+            failure += 1
+            errors[err_name(type(result)) or type(result).__name__] += 1
+
+    # The shared empty-timestamp error is tallied separately and folded in once
+    if empty:
+        failure += empty
+        errors["ValueError"] += empty
 
-    return results
+    return {"success": success, "failure": failure, "errors": errors}
@@ -1,51 +1,217 @@
 """
 Main benchmark runner with cProfile integration.
-Profiles all 6 combinations and displays comprehensive results.
+Times all 6 combinations, plus their single-frame inlined variants, without a
+profiler, profiles them separately for per-function stats, and displays
+comprehensive results.
 """
+import argparse
+import gc
+import importlib
+import multiprocessing
 import json
 import cProfile
 import pstats
-import io
+import os
+import re
+import statistics
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from typing import Dict, Any, List
 import time
 from datetime import datetime
 
-import benchmark_exception
-import benchmark_union
-import benchmark_tuple
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# Comparison table rows: (implementation, stack, benchmark name, depth key).
+# Speedups are relative to the BASELINE_IMPL row with the same depth key, so
+# the single-frame inlined runs are compared among themselves
+BENCHMARK_LAYOUT = [
+    ('Exception Handling', 'Shallow', 'Exception Handling - Shallow Stack', 'shallow'),
+    ('Exception Handling', 'Deep', 'Exception Handling - Deep Stack', 'deep'),
+    ('Union (Result | Exception)', 'Shallow',
+     'Union Error (Result | Exception) - Shallow Stack', 'shallow'),
+    ('Union (Result | Exception)', 'Deep',
+     'Union Error (Result | Exception) - Deep Stack', 'deep'),
+    ('Tuple (Result, Error)', 'Shallow', 'Tuple Error (Result, Error) - Shallow Stack', 'shallow'),
+    ('Tuple (Result, Error)', 'Deep', 'Tuple Error (Result, Error) - Deep Stack', 'deep'),
+    ('Exception Handling', 'Shallow (inlined)',
+     'Exception Handling - Shallow Stack (inlined)', 'shallow_inlined'),
+    ('Exception Handling', 'Deep (inlined)',
+     'Exception Handling - Deep Stack (inlined)', 'deep_inlined'),
+    ('Union (Result | Exception)', 'Shallow (inlined)',
+     'Union Error (Result | Exception) - Shallow Stack (inlined)', 'shallow_inlined'),
+    ('Union (Result | Exception)', 'Deep (inlined)',
+     'Union Error (Result | Exception) - Deep Stack (inlined)', 'deep_inlined'),
+    ('Tuple (Result, Error)', 'Shallow (inlined)',
+     'Tuple Error (Result, Error) - Shallow Stack (inlined)', 'shallow_inlined'),
+    ('Tuple (Result, Error)', 'Deep (inlined)',
+     'Tuple Error (Result, Error) - Deep Stack (inlined)', 'deep_inlined'),
+]
+
+BASELINE_IMPL = 'Exception Handling'
+
+# KEY FINDINGS heading for each layered BENCHMARK_LAYOUT depth key
+DEPTH_HEADINGS = {
+    'shallow': "Shallow Stack (2-3 levels)",
+    'deep': "Deep Stack (4-5 levels)",
+}
+
+# KEY FINDINGS wording per implementation: (timing row label, delta label)
+FINDINGS_LABELS = {
+    'Exception Handling': ('Exception handling', 'Exceptions'),
+    'Union (Result | Exception)': ('Union error', 'Union'),
+    'Tuple (Result, Error)': ('Tuple error', 'Tuple'),
+}
+
+# Pattern count from which extract_function_stats matches with numpy masks
+VECTORIZED_MIN_PATTERNS = 16
+
+
+def load_test_cases(filename: str = "test_cases.jsonl") -> List[Dict[str, Any]]:
+    """Load test cases from a JSON-lines file (or a legacy JSON array file)."""
+    # orjson parses straight from bytes; stdlib json is the fallback
+    loads = orjson.loads if orjson is not None else json.loads
+
+    with open(filename, 'rb') as f:
+        # Older test_cases.json files hold one big array
+        if f.peek(1)[:1] == b'[':
+            return loads(f.read())
+
+        # Every benchmark iterates the cases several times, so they are
+        # materialized here - but parsed a line at a time
+        return [loads(line) for line in f if line.strip()]
+
+
+def time_function(func, test_cases, repeat: int = 1):
+    """Time a function with no profiler attached - median of repeat runs."""
+    times = []
+    gc_was_enabled = gc.isenabled()
+
+    try:
+        for _ in range(repeat):
+            # Start every run from a clean heap and keep GC pauses out of it
+            gc.collect()
+            gc.disable()
+
+            start_time = time.perf_counter_ns()
+            result = func(test_cases)
+            end_time = time.perf_counter_ns()
+
+            gc.enable()
+            times.append((end_time - start_time) / 1e9)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+        else:
+            gc.disable()
+
+    return {
+        'result': result,
+        'total_time': statistics.median(times),
+        'times': times
+    }
+
+
+def resolve_benchmark(benchmark: Dict[str, Any]):
+    """Import a benchmark's module on first use and return its runner."""
+    return getattr(importlib.import_module(benchmark['module']), benchmark['func_name'])
+
+
+def available_cpus() -> int:
+    """CPUs this process may run on - its affinity mask, not the machine total."""
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.process_cpu_count() or 1
+
+
+def _pin_worker(cpu_queue):
+    """Pool initializer - pins each worker process to its own CPU, once."""
+    # Every worker takes a distinct CPU off the queue, so benchmarks running
+    # at the same time never share a core whichever worker picks them up
+    os.sched_setaffinity(0, {cpu_queue.get()})
 
 
-def load_test_cases(filename: str = "test_cases.json") -> List[Dict[str, Any]]:
-    """Load test cases from JSON file."""
-    with open(filename, 'r') as f:
-        return json.load(f)
+def _time_in_worker(benchmark: Dict[str, Any], filename: str, repeat: int):
+    """Process pool entry point - loads its own test cases and times one benchmark."""
+    # Only the module this benchmark needs gets imported in the worker, and
+    # re-reading the file is cheaper than pickling every test case across
+    func = resolve_benchmark(benchmark)
+    return time_function(func, load_test_cases(filename), repeat)
 
 
-def profile_function(func, test_cases):
-    """Profile a function using cProfile and return stats."""
+def time_benchmarks_parallel(benchmarks, filename: str, repeat: int, jobs: int):
+    """Run the timing pass for every benchmark across a process pool of jobs workers."""
+    pool_args: Dict[str, Any] = {'max_workers': jobs}
+    if hasattr(os, 'sched_setaffinity'):
+        # One queued CPU per worker - never more workers than CPUs to hand out
+        cpus = sorted(os.sched_getaffinity(0))[:jobs]
+        cpu_queue = multiprocessing.Queue()
+        for cpu in cpus:
+            cpu_queue.put(cpu)
+        pool_args.update(max_workers=len(cpus), initializer=_pin_worker,
+                         initargs=(cpu_queue,))
+
+    timings = {}
+    with ProcessPoolExecutor(**pool_args) as pool:
+        futures = {
+            pool.submit(_time_in_worker, benchmark, filename, repeat): benchmark['name']
+            for benchmark in benchmarks
+        }
+        for future in as_completed(futures):
+            name = futures[future]
+            timings[name] = future.result()
+            print(f"Timed: {name} in {timings[name]['total_time']:.6f} seconds (median)")
+
+    return timings
+
+
+def profile_function_for_stats(func, test_cases):
+    """Profile a function using cProfile and return stats - its timing is discarded."""
     profiler = cProfile.Profile()
 
     # Profile the function
     profiler.enable()
-    start_time = time.perf_counter()
-    result = func(test_cases)
-    end_time = time.perf_counter()
+    func(test_cases)
     profiler.disable()
 
-    # Get stats
-    s = io.StringIO()
-    ps = pstats.Stats(profiler, stream=s)
-    ps.strip_dirs()
-    ps.sort_stats('cumulative')
+    # Get stats - extract_function_stats only reads the raw entries by function
+    # name, so neither strip_dirs() nor a sort is needed
+    ps = pstats.Stats(profiler)
 
     return {
-        'result': result,
-        'total_time': end_time - start_time,
         'profiler': profiler,
         'stats': ps
     }
 
 
+def _match_patterns_vectorized(name_map: Dict[str, tuple], func_patterns: List[str]) -> Dict[str, tuple]:
+    """Pattern -> stats row via numpy substring masks, same precedence as the loop."""
+    names = np.array(list(name_map), dtype=str)
+    rows = list(name_map.values())
+    claimed = np.zeros(len(names), dtype=bool)
+    matched = {}
+
+    for pattern in func_patterns:
+        # Names already taken by an earlier pattern are masked out, and the
+        # last remaining hit wins just like the dict overwrite in the loop
+        mask = (np.char.find(names, pattern) >= 0) & ~claimed
+        claimed |= mask
+        hits = np.flatnonzero(mask)
+        if hits.size:
+            matched[pattern] = rows[hits[-1]]
+
+    return matched
+
+
 def extract_function_stats(stats: pstats.Stats, func_patterns: List[str]) -> Dict[str, Dict[str, float]]:
     """Extract timing information for specific functions from profiler stats."""
     function_times = {}
@@ -59,63 +225,139 @@ def extract_function_stats(stats: pstats.Stats, func_patterns: List[str]) -> Dic
             'percall_cum': 0.0
         }
 
-    # Get the stats dictionary
-    for func, (cc, nc, tt, ct, callers) in stats.stats.items():
-        func_name = func[2]  # function name
-
-        for pattern in func_patterns:
-            if pattern in func_name:
-                function_times[pattern]['ncalls'] = nc
-                function_times[pattern]['tottime'] = tt
-                function_times[pattern]['cumtime'] = ct
-                function_times[pattern]['percall_tot'] = tt / \
-                    nc if nc > 0 else 0
-                function_times[pattern]['percall_cum'] = ct / \
-                    nc if nc > 0 else 0
-                break
+    # Index the stats by function name once - the file/line part of the key and
+    # the callers table are never needed, and repeated names collapse to one entry
+    name_map = {func[2]: (nc, tt, ct)
+                for func, (cc, nc, tt, ct, callers) in stats.stats.items()}
+
+    # Each function is credited to the first pattern it contains; numpy only
+    # pays off once there are enough patterns to outweigh building the arrays
+    matched = {}
+    if np is not None and len(func_patterns) >= VECTORIZED_MIN_PATTERNS:
+        matched = _match_patterns_vectorized(name_map, func_patterns)
+    elif func_patterns:
+        # One alternation branch per pattern, tried in list order with a lazy
+        # scan ahead of each, so a single match() finds the first pattern
+        # contained anywhere in the name; lastindex says which branch it was
+        first_match = re.compile("(?s)" + "|".join(
+            f".*?({re.escape(pattern)})" for pattern in func_patterns)).match
+        for func_name, row in name_map.items():
+            m = first_match(func_name)
+            if m is not None:
+                matched[func_patterns[m.lastindex - 1]] = row
+
+    for pattern, (nc, tt, ct) in matched.items():
+        function_times[pattern]['ncalls'] = nc
+        function_times[pattern]['tottime'] = tt
+        function_times[pattern]['cumtime'] = ct
+        function_times[pattern]['percall_tot'] = tt / \
+            nc if nc > 0 else 0
+        function_times[pattern]['percall_cum'] = ct / \
+            nc if nc > 0 else 0
 
     return function_times
 
 
-def print_separator(char='=', length=100):
-    """Print a separator line."""
-    print(char * length)
+def comparison_rows(results: Dict[str, Any], n_cases: int):
+    """Yield (impl, stack, total_time, us_per_test, speedup) per BENCHMARK_LAYOUT row."""
+    baselines = {depth: results[name]['total_time']
+                 for impl, _, name, depth in BENCHMARK_LAYOUT if impl == BASELINE_IMPL}
 
+    for impl, stack, name, depth in BENCHMARK_LAYOUT:
+        total_time = results[name]['total_time']
+        yield (impl, stack, total_time, (total_time / n_cases) * 1_000_000,
+               baselines[depth] / total_time)
 
-def print_benchmark_result(name: str, profile_data: Dict[str, Any], func_patterns: List[str]):
-    """Print detailed results for a single benchmark."""
-    print_separator()
-    print(f"BENCHMARK: {name}")
-    print_separator()
 
+def _format_benchmark_block(name: str, profile_data: Dict[str, Any], n_cases: int) -> str:
+    """Format the detailed results block for a single benchmark."""
     result = profile_data['result']
+    function_stats = profile_data['function_stats']
     total_time = profile_data['total_time']
-    stats = profile_data['stats']
 
-    print(f"\nTotal Time: {total_time:.6f} seconds")
-    print(f"Success: {result['success']}")
-    print(f"Failures: {result['failure']}")
-    print(
-        f"Average time per test case: {(total_time / 1000) * 1000000:.2f} µs")
-
-    # Extract function-level stats
-    function_stats = extract_function_stats(stats, func_patterns)
-
-    print("\nFunction-level breakdown:")
-    print(f"{'Function':<40} {'Calls':>10} {'TotTime':>12} {'PerCall':>12} {'CumTime':>12}")
-    print('-' * 90)
+    lines = [
+        "=" * 100,
+        f"BENCHMARK: {name}",
+        "=" * 100,
+        "",
+        f"Total Time: {total_time:.6f} seconds",
+        f"Success: {result['success']}",
+        f"Failures: {result['failure']}",
+        f"Average time per test case: {(total_time / n_cases) * 1_000_000:.2f} µs",
+        "",
+        "Function-level breakdown:",
+        f"{'Function':<40} {'Calls':>10} {'TotTime':>12} {'PerCall':>12} {'CumTime':>12}",
+        '-' * 90,
+    ]
 
     for func_name, data in function_stats.items():
         if data['ncalls'] > 0:
-            print(f"{func_name:<40} {data['ncalls']:>10} "
-                  f"{data['tottime']:>12.6f} {data['percall_tot']:>12.9f} "
-                  f"{data['cumtime']:>12.6f}")
+            lines.append(f"{func_name:<40} {data['ncalls']:>10} "
+                         f"{data['tottime']:>12.6f} {data['percall_tot']:>12.9f} "
+                         f"{data['cumtime']:>12.6f}")
+
+    # Trailing blank line separates consecutive blocks
+    lines.append("\n")
+    return "\n".join(lines)
+
+
+def _format_comparison_table(results: Dict[str, Any], n_cases: int) -> str:
+    """Format the performance comparison table across all benchmarks."""
+    lines = [
+        "=" * 100,
+        "PERFORMANCE COMPARISON",
+        "=" * 100,
+        "",
+        f"{'Implementation':<42} {'Stack':>18} {'Total Time':>15} {'µs/test':>12} {'Speedup':>10}",
+        '-' * 100,
+    ]
+
+    for impl, stack, total_time, us_per_test, speedup in comparison_rows(results, n_cases):
+        speedup_str = f"{speedup:.2f}x"
+
+        lines.append(
+            f"{impl:<42} {stack:>18} {total_time:>15.6f}s {us_per_test:>11.2f} {speedup_str:>10}")
+
+    lines.append("\n")
+    return "\n".join(lines)
 
-    print()
 
+def fmt_delta(label: str, t: float, baseline: float) -> str:
+    """Format how much faster or slower t is than the exception baseline."""
+    pct = (baseline - t) / baseline * 100
+    verb = "faster" if pct > 0 else "slower"
+    return f"  → {label} is {abs(pct):.1f}% {verb} than exceptions"
 
-def save_results_json(results: Dict, benchmarks: List[Dict], filename: str):
-    """Save benchmark results to JSON file."""
+
+def _format_key_findings(results: Dict[str, Any]) -> str:
+    """Format the per-depth summary of each error-value style against exceptions."""
+    lines = [
+        "",
+        "KEY FINDINGS:",
+        "-" * 100,
+    ]
+    width = max(len(label) for label, _ in FINDINGS_LABELS.values()) + 1
+
+    for depth, heading in DEPTH_HEADINGS.items():
+        # Times for this depth's rows, looked up once, in BENCHMARK_LAYOUT order
+        times = {impl: results[name]['total_time']
+                 for impl, _, name, row_depth in BENCHMARK_LAYOUT if row_depth == depth}
+        baseline = times[BASELINE_IMPL]
+
+        lines += ["", f"{heading}:"]
+        for impl, t in times.items():
+            ratio = "baseline" if impl == BASELINE_IMPL else f"{t / baseline:.2f}x"
+            lines.append(f"  {FINDINGS_LABELS[impl][0] + ':':<{width}} {t:.6f}s ({ratio})")
+        lines += [fmt_delta(FINDINGS_LABELS[impl][1], t, baseline)
+                  for impl, t in times.items() if impl != BASELINE_IMPL]
+
+    lines.append("\n")
+    return "\n".join(lines)
+
+
+def save_results_json(results: Dict, benchmarks: List[Dict], filename: str, n_cases: int,
+                      pretty: bool = False):
+    """Save benchmark results to JSON file - compact unless pretty is set."""
     timestamp = datetime.now().isoformat()
 
     output_data = {
@@ -127,283 +369,225 @@ def save_results_json(results: Dict, benchmarks: List[Dict], filename: str):
         name = benchmark['name']
         profile_data = results[name]
 
-        # Extract function stats
-        function_stats = extract_function_stats(
-            profile_data['stats'], benchmark['patterns'])
-
         bench_data = {
             'name': name,
             'total_time': profile_data['total_time'],
+            'times': profile_data['times'],
             'success': profile_data['result']['success'],
             'failures': profile_data['result']['failure'],
-            'us_per_test': (profile_data['total_time'] / 1000) * 1000000,
-            'function_stats': function_stats
+            'us_per_test': (profile_data['total_time'] / n_cases) * 1_000_000,
+            'function_stats': profile_data['function_stats']
         }
         output_data['benchmarks'].append(bench_data)
 
-    with open(filename, 'w') as f:
-        json.dump(output_data, f, indent=2)
+    # Write orjson's bytes directly - decoding to str first would undo the gain.
+    # The file is for tooling (the .txt report is the readable one), so it is
+    # compact by default; a large buffer turns json.dump's many small writes
+    # into a few syscalls
+    if orjson is not None:
+        with open(filename, 'wb', buffering=1 << 20) as f:
+            f.write(orjson.dumps(output_data, option=orjson.OPT_INDENT_2 if pretty else None))
+    else:
+        with open(filename, 'w', buffering=1 << 20) as f:
+            if pretty:
+                json.dump(output_data, f, indent=2)
+            else:
+                json.dump(output_data, f, separators=(',', ':'))
 
     print(f"\nResults saved to {filename}")
 
 
-def save_results_text(results: Dict, benchmarks: List[Dict], filename: str):
+def save_results_text(results: Dict, benchmarks: List[Dict], filename: str, n_cases: int):
     """Save benchmark results to text file."""
     with open(filename, 'w') as f:
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         f.write(f"Benchmark Results - {timestamp}\n")
         f.write("=" * 100 + "\n\n")
 
-        # Write detailed results
-        for benchmark in benchmarks:
-            name = benchmark['name']
-            profile_data = results[name]
-            result = profile_data['result']
-            total_time = profile_data['total_time']
-
-            f.write("=" * 100 + "\n")
-            f.write(f"BENCHMARK: {name}\n")
-            f.write("=" * 100 + "\n\n")
-
-            f.write(f"Total Time: {total_time:.6f} seconds\n")
-            f.write(f"Success: {result['success']}\n")
-            f.write(f"Failures: {result['failure']}\n")
-            f.write(
-                f"Average time per test case: {(total_time / 1000) * 1000000:.2f} µs\n\n")
-
-            # Extract function-level stats
-            function_stats = extract_function_stats(
-                profile_data['stats'], benchmark['patterns'])
-
-            f.write("Function-level breakdown:\n")
-            f.write(
-                f"{'Function':<40} {'Calls':>10} {'TotTime':>12} {'PerCall':>12} {'CumTime':>12}\n")
-            f.write('-' * 90 + "\n")
-
-            for func_name, data in function_stats.items():
-                if data['ncalls'] > 0:
-                    f.write(f"{func_name:<40} {data['ncalls']:>10} "
-                            f"{data['tottime']:>12.6f} {data['percall_tot']:>12.9f} "
-                            f"{data['cumtime']:>12.6f}\n")
-
-            f.write("\n")
+        # Write detailed results - every block is formatted, then written once
+        f.write("".join(
+            _format_benchmark_block(benchmark['name'], results[benchmark['name']], n_cases)
+            for benchmark in benchmarks))
 
         # Write comparison table
-        f.write("=" * 100 + "\n")
-        f.write("PERFORMANCE COMPARISON\n")
-        f.write("=" * 100 + "\n\n")
-
-        baseline_shallow = results['Exception Handling - Shallow Stack']['total_time']
-        baseline_deep = results['Exception Handling - Deep Stack']['total_time']
-
-        f.write(
-            f"{'Implementation':<50} {'Stack':>10} {'Total Time':>15} {'µs/test':>12} {'Speedup':>10}\n")
-        f.write('-' * 100 + "\n")
-
-        comparison_data = [
-            ('Exception Handling', 'Shallow',
-             results['Exception Handling - Shallow Stack'], baseline_shallow),
-            ('Exception Handling', 'Deep',
-             results['Exception Handling - Deep Stack'], baseline_deep),
-            ('Union (Result | Exception)', 'Shallow',
-             results['Union Error (Result | Exception) - Shallow Stack'], baseline_shallow),
-            ('Union (Result | Exception)', 'Deep',
-             results['Union Error (Result | Exception) - Deep Stack'], baseline_deep),
-            ('Tuple (Result, Error)', 'Shallow',
-             results['Tuple Error (Result, Error) - Shallow Stack'], baseline_shallow),
-            ('Tuple (Result, Error)', 'Deep',
-             results['Tuple Error (Result, Error) - Deep Stack'], baseline_deep),
-        ]
-
-        for impl, stack, data, baseline in comparison_data:
-            total_time = data['total_time']
-            us_per_test = (total_time / 1000) * 1000000
-            speedup = baseline / total_time
-            speedup_str = f"{speedup:.2f}x"
-
-            f.write(
-                f"{impl:<50} {stack:>10} {total_time:>15.6f}s {us_per_test:>11.2f} {speedup_str:>10}\n")
-
-        f.write("\n")
+        f.write(_format_comparison_table(results, n_cases))
 
     print(f"Results saved to {filename}")
 
 
-def run_all_benchmarks():
-    """Run all 6 benchmark combinations and display results."""
+def run_all_benchmarks(repeat: int = 7, jobs: int | None = None,
+                       filename: str = "test_cases.jsonl", pretty: bool = False):
+    """Run all 6 benchmark combinations plus their inlined variants and display results."""
     print("Loading test cases...")
-    test_cases = load_test_cases()
-    print(f"Loaded {len(test_cases)} test cases\n")
+    test_cases = load_test_cases(filename)
+    n_cases = len(test_cases)
+    print(f"Loaded {n_cases} test cases\n")
 
     benchmarks = [
         {
             'name': 'Exception Handling - Shallow Stack',
-            'func': benchmark_exception.run_shallow_exc,
+            'module': 'benchmark_exception',
+            'func_name': 'run_shallow_exc',
             'patterns': ['validate_format_shallow_exc', 'parse_datetime_shallow_exc',
                          'parse_message_shallow_exc']
         },
         {
             'name': 'Exception Handling - Deep Stack',
-            'func': benchmark_exception.run_deep_exc,
+            'module': 'benchmark_exception',
+            'func_name': 'run_deep_exc',
             'patterns': ['validate_format_deep_exc', 'parse_datetime_deep_exc',
                          'parse_message_deep_exc', 'validate_message_deep_exc',
                          'process_batch_deep_exc']
         },
         {
             'name': 'Union Error (Result | Exception) - Shallow Stack',
-            'func': benchmark_union.run_shallow_union,
+            'module': 'benchmark_union',
+            'func_name': 'run_shallow_union',
             'patterns': ['validate_format_shallow_union', 'parse_datetime_shallow_union',
                          'parse_message_shallow_union']
         },
         {
             'name': 'Union Error (Result | Exception) - Deep Stack',
-            'func': benchmark_union.run_deep_union,
+            'module': 'benchmark_union',
+            'func_name': 'run_deep_union',
             'patterns': ['validate_format_deep_union', 'parse_datetime_deep_union',
                          'parse_message_deep_union', 'validate_message_deep_union',
                          'process_batch_deep_union']
         },
         {
             'name': 'Tuple Error (Result, Error) - Shallow Stack',
-            'func': benchmark_tuple.run_shallow_tuple,
+            'module': 'benchmark_tuple',
+            'func_name': 'run_shallow_tuple',
             'patterns': ['validate_format_shallow_tuple', 'parse_datetime_shallow_tuple',
                          'parse_message_shallow_tuple']
         },
         {
             'name': 'Tuple Error (Result, Error) - Deep Stack',
-            'func': benchmark_tuple.run_deep_tuple,
+            'module': 'benchmark_tuple',
+            'func_name': 'run_deep_tuple',
             'patterns': ['validate_format_deep_tuple', 'parse_datetime_deep_tuple',
                          'parse_message_deep_tuple', 'validate_message_deep_tuple',
                          'process_batch_deep_tuple']
         },
+        # Same pipelines run in a single frame, for comparison with the above
+        {
+            'name': 'Exception Handling - Shallow Stack (inlined)',
+            'module': 'benchmark_exception',
+            'func_name': 'run_shallow_exc_inlined',
+            'patterns': ['parse_message_shallow_exc_inlined']
+        },
+        {
+            'name': 'Exception Handling - Deep Stack (inlined)',
+            'module': 'benchmark_exception',
+            'func_name': 'run_deep_exc_inlined',
+            'patterns': ['process_batch_deep_exc_inlined']
+        },
+        {
+            'name': 'Union Error (Result | Exception) - Shallow Stack (inlined)',
+            'module': 'benchmark_union',
+            'func_name': 'run_shallow_union_inlined',
+            'patterns': ['parse_message_shallow_union_inlined']
+        },
+        {
+            'name': 'Union Error (Result | Exception) - Deep Stack (inlined)',
+            'module': 'benchmark_union',
+            'func_name': 'run_deep_union_inlined',
+            'patterns': ['process_batch_deep_union_inlined']
+        },
+        {
+            'name': 'Tuple Error (Result, Error) - Shallow Stack (inlined)',
+            'module': 'benchmark_tuple',
+            'func_name': 'run_shallow_tuple_inlined',
+            'patterns': ['parse_message_shallow_tuple_inlined']
+        },
+        {
+            'name': 'Tuple Error (Result, Error) - Deep Stack (inlined)',
+            'module': 'benchmark_tuple',
+            'func_name': 'run_deep_tuple_inlined',
+            'patterns': ['process_batch_deep_tuple_inlined']
+        },
     ]
 
     results = {}
 
-    for benchmark in benchmarks:
-        print(f"\nRunning: {benchmark['name']}...")
-        profile_data = profile_function(benchmark['func'], test_cases)
-        results[benchmark['name']] = profile_data
-        print(f"Completed in {profile_data['total_time']:.6f} seconds")
-
-    # Print detailed results
-    print("\n")
-    print_separator('=', 100)
-    print("DETAILED RESULTS")
-    print_separator('=', 100)
+    # The benchmarks share no state, so the timing pass can fan out across
+    # processes; profiling below always stays serial
+    timings = {}
+    # One process per usable CPU at most - more would have benchmarks timed
+    # while sharing a core
+    cpus = available_cpus()
+    if jobs is None:
+        jobs = cpus
+    elif jobs > cpus:
+        print(f"Only {cpus} CPU(s) available - timing with {cpus} process(es) instead of {jobs}")
+        jobs = cpus
+    jobs = min(jobs, len(benchmarks))
+
+    if jobs > 1:
+        print(f"Timing {len(benchmarks)} benchmarks across {jobs} processes ({repeat} runs each)...")
+        timings = time_benchmarks_parallel(benchmarks, filename, repeat, jobs)
 
     for benchmark in benchmarks:
-        print_benchmark_result(
-            benchmark['name'],
-            results[benchmark['name']],
-            benchmark['patterns']
-        )
-
-    # Print comparison table
-    print_separator('=', 100)
-    print("PERFORMANCE COMPARISON")
-    print_separator('=', 100)
-    print()
-
-    print(f"{'Implementation':<50} {'Stack':>10} {'Total Time':>15} {'µs/test':>12} {'Speedup':>10}")
-    print('-' * 100)
-
-    baseline_shallow = results['Exception Handling - Shallow Stack']['total_time']
-    baseline_deep = results['Exception Handling - Deep Stack']['total_time']
-
-    comparison_data = [
-        ('Exception Handling', 'Shallow',
-         results['Exception Handling - Shallow Stack'], baseline_shallow),
-        ('Exception Handling', 'Deep',
-         results['Exception Handling - Deep Stack'], baseline_deep),
-        ('Union (Result | Exception)', 'Shallow',
-         results['Union Error (Result | Exception) - Shallow Stack'], baseline_shallow),
-        ('Union (Result | Exception)', 'Deep',
-         results['Union Error (Result | Exception) - Deep Stack'], baseline_deep),
-        ('Tuple (Result, Error)', 'Shallow',
-         results['Tuple Error (Result, Error) - Shallow Stack'], baseline_shallow),
-        ('Tuple (Result, Error)', 'Deep',
-         results['Tuple Error (Result, Error) - Deep Stack'], baseline_deep),
-    ]
-
-    for impl, stack, data, baseline in comparison_data:
-        total_time = data['total_time']
-        us_per_test = (total_time / 1000) * 1000000
-        speedup = baseline / total_time
-        speedup_str = f"{speedup:.2f}x"
-
-        print(
-            f"{impl:<50} {stack:>10} {total_time:>15.6f}s {us_per_test:>11.2f} {speedup_str:>10}")
-
-    print()
-    print_separator('=', 100)
-
-    # Summary
-    print("\nKEY FINDINGS:")
-    print("-" * 100)
-
-    exc_shallow_time = results['Exception Handling - Shallow Stack']['total_time']
-    union_shallow_time = results['Union Error (Result | Exception) - Shallow Stack']['total_time']
-    tuple_shallow_time = results['Tuple Error (Result, Error) - Shallow Stack']['total_time']
-
-    exc_deep_time = results['Exception Handling - Deep Stack']['total_time']
-    union_deep_time = results['Union Error (Result | Exception) - Deep Stack']['total_time']
-    tuple_deep_time = results['Tuple Error (Result, Error) - Deep Stack']['total_time']
-
-    print(f"\nShallow Stack (2-3 levels):")
-    print(f"  Exception handling: {exc_shallow_time:.6f}s (baseline)")
-    print(
-        f"  Union error:        {union_shallow_time:.6f}s ({(union_shallow_time/exc_shallow_time):.2f}x)")
-    print(
-        f"  Tuple error:        {tuple_shallow_time:.6f}s ({(tuple_shallow_time/exc_shallow_time):.2f}x)")
-
-    if union_shallow_time < exc_shallow_time:
-        improvement = ((exc_shallow_time - union_shallow_time) /
-                       exc_shallow_time) * 100
-        print(f"  → Union is {improvement:.1f}% faster than exceptions")
-    else:
-        slowdown = ((union_shallow_time - exc_shallow_time) /
-                    exc_shallow_time) * 100
-        print(f"  → Union is {slowdown:.1f}% slower than exceptions")
-
-    if tuple_shallow_time < exc_shallow_time:
-        improvement = ((exc_shallow_time - tuple_shallow_time) /
-                       exc_shallow_time) * 100
-        print(f"  → Tuple is {improvement:.1f}% faster than exceptions")
-    else:
-        slowdown = ((tuple_shallow_time - exc_shallow_time) /
-                    exc_shallow_time) * 100
-        print(f"  → Tuple is {slowdown:.1f}% slower than exceptions")
-
-    print(f"\nDeep Stack (4-5 levels):")
-    print(f"  Exception handling: {exc_deep_time:.6f}s (baseline)")
-    print(
-        f"  Union error:        {union_deep_time:.6f}s ({(union_deep_time/exc_deep_time):.2f}x)")
-    print(
-        f"  Tuple error:        {tuple_deep_time:.6f}s ({(tuple_deep_time/exc_deep_time):.2f}x)")
-
-    if union_deep_time < exc_deep_time:
-        improvement = ((exc_deep_time - union_deep_time) / exc_deep_time) * 100
-        print(f"  → Union is {improvement:.1f}% faster than exceptions")
-    else:
-        slowdown = ((union_deep_time - exc_deep_time) / exc_deep_time) * 100
-        print(f"  → Union is {slowdown:.1f}% slower than exceptions")
-
-    if tuple_deep_time < exc_deep_time:
-        improvement = ((exc_deep_time - tuple_deep_time) / exc_deep_time) * 100
-        print(f"  → Tuple is {improvement:.1f}% faster than exceptions")
-    else:
-        slowdown = ((tuple_deep_time - exc_deep_time) / exc_deep_time) * 100
-        print(f"  → Tuple is {slowdown:.1f}% slower than exceptions")
-
-    print()
+        # Each implementation module is imported right before its first run
+        func = resolve_benchmark(benchmark)
+
+        # Clean timing pass first; cProfile's overhead is uneven across the
+        # implementations (raising fires extra events), so it only feeds the
+        # per-function breakdown
+        if benchmark['name'] in timings:
+            print(f"\nProfiling: {benchmark['name']}...")
+            profile_data = timings[benchmark['name']]
+        else:
+            print(f"\nRunning: {benchmark['name']} ({repeat} runs)...")
+            profile_data = time_function(func, test_cases, repeat)
+        profile_data.update(profile_function_for_stats(func, test_cases))
+
+        # Extract function-level stats once - every report below reuses them
+        profile_data['function_stats'] = extract_function_stats(
+            profile_data.pop('stats'), benchmark['patterns'])
+
+        # Only the extracted numbers are kept; the profiler and its per-function
+        # tables are released before the next benchmark runs
+        del profile_data['profiler']
+        gc.collect()
+        results[benchmark['name']] = profile_data
+        print(f"Completed in {profile_data['total_time']:.6f} seconds (median)")
+
+    # The whole report is built first and written to stdout in one go rather
+    # than as one print() per line
+    sys.stdout.write("".join([
+        "\n\n",
+        "=" * 100 + "\n",
+        "DETAILED RESULTS\n",
+        "=" * 100 + "\n",
+        *(_format_benchmark_block(benchmark['name'], results[benchmark['name']], n_cases)
+          for benchmark in benchmarks),
+        _format_comparison_table(results, n_cases),
+        "=" * 100 + "\n",
+        _format_key_findings(results),
+    ]))
 
     # Save results to files
     timestamp_str = datetime.now().strftime("%Y%m%d_%H%M%S")
     save_results_json(results, benchmarks,
-                      f"benchmark_results_{timestamp_str}.json")
+                      f"benchmark_results_{timestamp_str}.json", n_cases, pretty)
     save_results_text(results, benchmarks,
-                      f"benchmark_results_{timestamp_str}.txt")
+                      f"benchmark_results_{timestamp_str}.txt", n_cases)
 
 
 if __name__ == "__main__":
-    run_all_benchmarks()
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--repeat", type=int, default=7,
+                        help="timed runs per benchmark; the median is reported (default: 7)")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="processes for the timing pass, capped at the usable CPUs; "
+                             "1 times serially (default: one per usable CPU)")
+    parser.add_argument("--pretty", action="store_true",
+                        help="indent the JSON results file (default: compact)")
+    args = parser.parse_args()
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+    if args.jobs is not None and args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+
+    run_all_benchmarks(repeat=args.repeat, jobs=args.jobs, pretty=args.pretty)
@@ -0,0 +1,52 @@
+"""
+Optional compiled build of the benchmark implementations.
+    ERV_COMPILER=cython python setup.py build_ext --inplace  # Cython
+    ERV_COMPILER=mypyc python setup.py build_ext --inplace   # mypyc
+Either backend builds all three modules, so they are always compared like for
+like. Without ERV_COMPILER nothing is compiled (a plain `pip install -e .`
+included) and the .py sources are what runs.
+"""
+import os
+
+from setuptools import setup
+
+
+MODULES = ["benchmark_exception.py", "benchmark_tuple.py", "benchmark_union.py"]
+
+COMPILER_DIRECTIVES = {
+    "language_level": "3",
+    "boundscheck": False,
+    "wraparound": False,
+}
+
+
+def build_extensions():
+    """Compile with the backend picked by ERV_COMPILER, or build nothing if it is unset."""
+    compiler = os.environ.get("ERV_COMPILER")
+    if not compiler:
+        return []
+
+    if compiler == "mypyc":
+        try:
+            from mypyc.build import mypycify
+        except ImportError:
+            print("mypyc not installed - skipping compiled benchmark modules")
+            return []
+        return mypycify(MODULES)
+
+    if compiler != "cython":
+        raise SystemExit(f"Unknown ERV_COMPILER {compiler!r} - expected 'cython' or 'mypyc'")
+
+    try:
+        from Cython.Build import cythonize
+    except ImportError:
+        print("Cython not installed - skipping compiled benchmark modules")
+        return []
+    return cythonize(MODULES, compiler_directives=COMPILER_DIRECTIVES)
+
+
+setup(
+    name="erv-bench",
+    py_modules=[],
+    ext_modules=build_extensions(),
+)
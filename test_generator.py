@@ -6,33 +6,81 @@ import json
 import random
 from typing import List, Dict, Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Sampling pools - module-level tuples, built once rather than on every call
+VALID_DATETIMES = (
+    "2024-01-15 10:30:45",
+    "2023-12-31 23:59:59",
+    "2024-06-15 14:22:33",
+    "2024-03-10 08:15:00",
+    "2024-09-20 17:45:12",
+    "2024-11-05 12:00:00",
+    "2024-02-29 09:30:15",  # leap year
+    "2024-07-04 16:20:55",
+    "2024-05-01 11:11:11",
+    "2024-08-18 19:45:30",
+)
+
+INVALID_FORMATS = (
+    "2024/01/15 10:30:45",  # wrong separator
+    "15-01-2024 10:30:45",  # wrong order
+    "2024-13-01 10:30:45",  # invalid month
+    "2024-01-32 10:30:45",  # invalid day
+    "2024-01-15 25:30:45",  # invalid hour
+    "2024-01-15 10:70:45",  # invalid minute
+    "2024-01-15 10:30:70",  # invalid second
+    "not-a-datetime",
+    "2024-01-15",  # missing time
+    "10:30:45",  # missing date
+    "2024-1-5 10:30:45",  # single digit month/day
+    "24-01-15 10:30:45",  # 2-digit year
+    "",  # empty string
+    "2024-02-30 10:30:45",  # invalid date for month
+    "abcd-ef-gh ij:kl:mn",
+)
+
+INVALID_TYPES = (
+    123456,
+    12345.67,
+    True,
+    False,
+    ["2024-01-15", "10:30:45"],
+    {"date": "2024-01-15", "time": "10:30:45"},
+    None,
+)
+
+MALFORMED_MESSAGES = (
+    None,
+    "not a dict",
+    123,
+    ["list", "of", "items"],
+    12.34,
+)
+
 
 def generate_test_cases() -> List[Dict[str, Any]]:
     """Generate 1000 test cases: 200 valid, 800 with errors."""
     test_cases = []
 
+    # Per-case strings built once, indexed by id in every block below
+    n_cases = 1000
+    users = [f"user_{i}" for i in range(n_cases)]
+    contents = [f"message content {i}" for i in range(n_cases)]
+
     # 200 valid cases
-    valid_datetimes = [
-        "2024-01-15 10:30:45",
-        "2023-12-31 23:59:59",
-        "2024-06-15 14:22:33",
-        "2024-03-10 08:15:00",
-        "2024-09-20 17:45:12",
-        "2024-11-05 12:00:00",
-        "2024-02-29 09:30:15",  # leap year
-        "2024-07-04 16:20:55",
-        "2024-05-01 11:11:11",
-        "2024-08-18 19:45:30",
-    ]
-
-    for i in range(200):
-        dt = random.choice(valid_datetimes)
+    # One C-level sampling call per block instead of a choice() per case
+    for i, dt in zip(range(200), random.choices(VALID_DATETIMES, k=200)):
         test_cases.append({
             "id": i,
             "message": {
                 "timestamp": dt,
-                "user": f"user_{i}",
-                "data": f"message content {i}"
+                "user": users[i],
+                "data": contents[i]
             },
             "expected_valid": True
         })
@@ -44,8 +92,8 @@ def generate_test_cases() -> List[Dict[str, Any]]:
         test_cases.append({
             "id": i,
             "message": {
-                "user": f"user_{i}",
-                "data": f"message content {i}"
+                "user": users[i],
+                "data": contents[i]
                 # Missing timestamp
             },
             "expected_valid": False,
@@ -53,70 +101,33 @@ def generate_test_cases() -> List[Dict[str, Any]]:
         })
 
     # 200 cases: Invalid datetime format (malformed strings)
-    invalid_formats = [
-        "2024/01/15 10:30:45",  # wrong separator
-        "15-01-2024 10:30:45",  # wrong order
-        "2024-13-01 10:30:45",  # invalid month
-        "2024-01-32 10:30:45",  # invalid day
-        "2024-01-15 25:30:45",  # invalid hour
-        "2024-01-15 10:70:45",  # invalid minute
-        "2024-01-15 10:30:70",  # invalid second
-        "not-a-datetime",
-        "2024-01-15",  # missing time
-        "10:30:45",  # missing date
-        "2024-1-5 10:30:45",  # single digit month/day
-        "24-01-15 10:30:45",  # 2-digit year
-        "",  # empty string
-        "2024-02-30 10:30:45",  # invalid date for month
-        "abcd-ef-gh ij:kl:mn",
-    ]
-
-    for i in range(400, 600):
-        dt = random.choice(invalid_formats)
+    for i, dt in zip(range(400, 600), random.choices(INVALID_FORMATS, k=200)):
         test_cases.append({
             "id": i,
             "message": {
                 "timestamp": dt,
-                "user": f"user_{i}",
-                "data": f"message content {i}"
+                "user": users[i],
+                "data": contents[i]
             },
             "expected_valid": False,
             "error_type": "invalid_format"
         })
 
     # 200 cases: Type errors (timestamp is not a string)
-    invalid_types = [
-        123456,
-        12345.67,
-        True,
-        False,
-        ["2024-01-15", "10:30:45"],
-        {"date": "2024-01-15", "time": "10:30:45"},
-        None,
-    ]
-
-    for i in range(600, 800):
-        dt = random.choice(invalid_types)
+    for i, dt in zip(range(600, 800), random.choices(INVALID_TYPES, k=200)):
         test_cases.append({
             "id": i,
             "message": {
                 "timestamp": dt,
-                "user": f"user_{i}",
-                "data": f"message content {i}"
+                "user": users[i],
+                "data": contents[i]
             },
             "expected_valid": False,
             "error_type": "type_error"
         })
 
     # 200 cases: Malformed message structure (not a dict, or None)
-    for i in range(800, 1000):
-        malformed = random.choice([
-            None,
-            "not a dict",
-            123,
-            ["list", "of", "items"],
-            12.34,
-        ])
+    for i, malformed in zip(range(800, 1000), random.choices(MALFORMED_MESSAGES, k=200)):
         test_cases.append({
             "id": i,
             "message": malformed,
@@ -130,11 +141,18 @@ def generate_test_cases() -> List[Dict[str, Any]]:
     return test_cases
 
 
-def save_test_cases(filename: str = "test_cases.json"):
-    """Generate and save test cases to a JSON file."""
+def save_test_cases(filename: str = "test_cases.jsonl"):
+    """Generate and save test cases to a JSON-lines file, one case per line."""
     test_cases = generate_test_cases()
-    with open(filename, 'w') as f:
-        json.dump(test_cases, f, indent=2)
+    # Each case is serialized and written on its own, so no single encoded
+    # blob of the whole list is ever held in memory
+    with open(filename, 'wb') as f:
+        if orjson is not None:
+            for tc in test_cases:
+                f.write(orjson.dumps(tc, option=orjson.OPT_APPEND_NEWLINE))
+        else:
+            for tc in test_cases:
+                f.write(json.dumps(tc).encode() + b"\n")
     print(f"Generated {len(test_cases)} test cases and saved to {filename}")
 
     # Print statistics